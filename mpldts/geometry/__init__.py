@@ -1,6 +1,16 @@
-from mpldts.geometry._geometry import DTGeometry, DTGEOMETRY
+from mpldts.geometry import _geometry
+from mpldts.geometry._geometry import DTGeometry
 from mpldts.geometry.dt_frame import DTFrame
 from mpldts.geometry.station import Station
 from mpldts.geometry.super_layer import SuperLayer
 from mpldts.geometry.layer import Layer
 from mpldts.geometry.drift_cell import DriftCell
+
+__all__ = ["DTGeometry", "DTGEOMETRY", "DTFrame", "Station", "SuperLayer", "Layer", "DriftCell"]
+
+
+def __getattr__(name):
+    # DTGEOMETRY is loaded on first access, see mpldts.geometry._geometry
+    if name == "DTGEOMETRY":
+        return _geometry.DTGEOMETRY
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
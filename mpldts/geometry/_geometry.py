@@ -1,6 +1,44 @@
 import os
-import re
-import xml.etree.ElementTree as ET
+from functools import cache
+import numpy as np
+
+try:
+    from lxml import etree as ET
+
+    _PARSER_OPTIONS = {"remove_comments": True}
+except ImportError:  # lxml is optional, fall back to the standard library parser
+    import xml.etree.ElementTree as ET
+
+    _PARSER_OPTIONS = {}
+
+# numeric (x, y, z)-like fields decoded once per rawId element at load time
+_VECTOR_FIELDS = ("LocalPosition", "GlobalPosition", "NormalVector", "Bounds")
+
+# (kwarg, tag, attribute) of the query criteria below the chamber level, in hierarchical order
+_QUERY_STEPS = (
+    ("sl", "SuperLayer", "superLayerNumber"),
+    ("l", "Layer", "layerNumber"),
+    ("w", "Wire", "wireNumber"),
+)
+
+# levels of the geometry hierarchy as (tag, tag of the element grouping them in their parent)
+_HIERARCHY = (
+    ("DTGeometry", None),
+    ("Chamber", "Chambers"),
+    ("SuperLayer", "SuperLayers"),
+    ("Layer", "Layers"),
+    ("Wire", "Wires"),
+)
+
+# child-axis paths from each level of the hierarchy to each of the levels below it,
+# e.g. ("Chamber", "Layer") -> "SuperLayers/SuperLayer/Layers/Layer"
+_CHILD_PATHS = {
+    (_HIERARCHY[i][0], _HIERARCHY[j][0]): "/".join(
+        f"{group}/{tag}" for tag, group in _HIERARCHY[i + 1 : j + 1]
+    )
+    for i in range(len(_HIERARCHY))
+    for j in range(i + 1, len(_HIERARCHY))
+}
 
 
 class DTGeometry:
@@ -9,8 +47,15 @@ class DTGeometry:
 
     Attributes
     ----------
-    root : xml.etree.ElementTree.Element
+    root : xml.etree.ElementTree.Element or lxml.etree._Element
         The root element of the parsed XML tree.
+
+    .. note::
+        - The XML file is parsed with `lxml <https://lxml.de/>`_ when it is installed, which is
+          considerably faster than the standard library ``xml.etree.ElementTree`` parser used otherwise.
+        - Results of :meth:`get` and :meth:`walk` are memoized per query, so repeated lookups of the same
+          object (e.g. when several DT objects share a parent, or the same station is built again) do not
+          traverse the XML tree again.
     """
 
     def __init__(self, xml_file):
@@ -20,8 +65,33 @@ class DTGeometry:
         :param xml_file: Path to the XML file containing the DT Geometry.
         :type xml_file: str
         """
-        tree = ET.parse(xml_file)
-        self.root = tree.getroot()
+        self._cache = {}
+        self._walks = {}
+        self._wires = {}
+        # index the elements that are usually queried while the file is parsed, to avoid
+        # scanning the whole tree per query
+        self._by_rawid = {}
+        self._by_chamber_id = {}
+        events = ET.iterparse(xml_file, events=("end",), **_PARSER_OPTIONS)
+        for _, element in events:
+            rawId = element.get("rawId")
+            if rawId is not None:
+                self._by_rawid[int(rawId)] = element
+                if element.tag == "Chamber":
+                    self._by_chamber_id[element.get("Id")] = element
+        self.root = events.root
+        # decode the numeric fields of each rawId element into (N, 3) arrays, one row per rawId
+        self._row = {rawId: row for row, rawId in enumerate(self._by_rawid)}
+        # all fields of a rawId are kept contiguous, so get_frame_attrs converts them in a single call
+        self._frames = np.array(
+            [
+                [self._read_vector(element, field) for field in _VECTOR_FIELDS]
+                for element in self._by_rawid.values()
+            ],
+            dtype=float,
+        ).reshape(-1, len(_VECTOR_FIELDS), 3)
+        self._frames.flags.writeable = False
+        self._vectors = {field: self._frames[:, i] for i, field in enumerate(_VECTOR_FIELDS)}
 
     def get(self, attribute=None, **kwargs):
         """
@@ -32,46 +102,195 @@ class DTGeometry:
         :param kwargs: Additional criteria to filter the elements (e.g., rawId, wh, sec, st, sl, l).
         :type kwargs: dict
         :return: The requested attribute values or element.
-        :rtype: tuple, str, or xml.etree.ElementTree.Element
+        :rtype: tuple, str, or xml.etree.ElementTree.Element (lxml.etree._Element if lxml is used)
         :raises ValueError: If the element or attribute is not found for the given query.
         """
+        if len(kwargs) == 1 and "rawId" in kwargs:
+            # most queries only use the rawId, skip building the generic key for them
+            key = (attribute, self._as_rawid(kwargs["rawId"]))
+        else:
+            key = (attribute, tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = self._lookup(attribute, **kwargs)
+        return self._cache[key]
+
+    def get_frame_attrs(self, rawId, w=None):
+        """
+        Retrieve at once the local position, global position, normal vector, and bounds of a rawId element
+        (Chamber, SuperLayer, or Layer), or of one of the wires of a Layer.
+
+        :param rawId: Raw identifier of the element.
+        :type rawId: int or str
+        :param w: Number of the wire, if the attributes of a drift cell of the Layer are requested.
+            Wires do not have a normal vector, so None is returned in its place. Default is None.
+        :type w: int, optional
+        :return: The (local position, global position, normal vector, bounds) tuple.
+        :rtype: tuple
+        :raises ValueError: If the element is not found for the given rawId (and wire).
+        """
+        if w is None:
+            row = self._row.get(self._as_rawid(rawId))
+            if row is None:
+                raise ValueError(f"Element not found for rawId: {rawId}")
+            return tuple(map(tuple, self._frames[row].tolist()))
+
+        wire = self.get(rawId=rawId, w=w)
+        if wire is None:
+            raise ValueError(f"Element not found for rawId: {rawId}, wire: {w}")
+        return (
+            self._read_vector(wire, "LocalPosition"),
+            self._read_vector(wire, "GlobalPosition"),
+            None,
+            self.get("WiresSize", rawId=rawId),
+        )
+
+    def walk(self, rawId):
+        """
+        Collect, in a single descent, the geometrical information of a rawId element (Chamber, SuperLayer,
+        or Layer) and of everything it contains.
+
+        Each level is described by a dictionary with the keys 'rawId', 'LocalPosition', 'GlobalPosition',
+        'NormalVector', 'Bounds', and 'children'. SuperLayers and Layers also have a 'number' key, and Layers
+        have the 'WiresSize' and 'WiresRange' keys. The children of a Layer are its wires, described by
+        dictionaries with the keys 'number', 'LocalPosition', 'GlobalPosition', and 'Bounds' (the
+        layer 'WiresSize').
+
+        :param rawId: Raw identifier of the element.
+        :type rawId: int or str
+        :return: The nested geometrical information of the element.
+        :rtype: dict
+        :raises ValueError: If the element is not found for the given rawId.
+
+        .. note::
+            The result is memoized per rawId and shared between calls (e.g. by every Station built for the
+            same chamber), so it must not be modified.
+        """
+        key = self._as_rawid(rawId)
+        if key not in self._walks:
+            self._walks[key] = self._walk(rawId)
+        return self._walks[key]
+
+    def _walk(self, rawId):
+        """
+        Perform the actual descent for :meth:`walk`. Arguments are the same as in :meth:`walk`.
+        """
+        frame_attrs = self.get_frame_attrs(rawId)  # raises if the rawId is not found
+        element = self._by_rawid[self._as_rawid(rawId)]
+        # the rawId is read from the XML attribute, so its type does not depend on the given form
+        info = {"rawId": element.get("rawId")}
+        info.update(zip(_VECTOR_FIELDS, frame_attrs))
+
+        if element.tag == "Chamber":
+            info["children"] = [self.walk(sl.get("rawId")) for sl in element.iter("SuperLayer")]
+        elif element.tag == "SuperLayer":
+            info["number"] = int(element.get("superLayerNumber"))
+            info["children"] = [self.walk(layer.get("rawId")) for layer in element.iter("Layer")]
+        elif element.tag == "Layer":
+            info["number"] = int(element.get("layerNumber"))
+            info["WiresSize"] = wires_size = self.get("WiresSize", rawId=rawId)
+            info["WiresRange"] = self.get("WiresRange", rawId=rawId)
+            info["children"] = [
+                {
+                    "number": int(wire.get("wireNumber")),
+                    "LocalPosition": self._transform_to_pos(wire.get("LocalPosition")),
+                    "GlobalPosition": self._transform_to_pos(wire.get("GlobalPosition")),
+                    "Bounds": wires_size,
+                }
+                for wire in self.get("Wires", rawId=rawId).iter("Wire")
+            ]
+        else:
+            info["children"] = []
+
+        return info
+
+    @staticmethod
+    def _as_rawid(rawId):
+        """
+        Convert a rawId to the integer used as key of the internal indexes. The rawId is matched by its
+        string representation, as the XML attribute is, so only integral values (e.g. 574922752 or
+        "574922752") are accepted. Other values (floats, bools, ...) map to None.
+        """
+        rawId = str(rawId)
+        if rawId.isascii() and rawId.isdigit():
+            return int(rawId)
+        return None
+
+    @staticmethod
+    def _find_child(element, tag, tag_attribute, value):
+        """
+        Find the first element with the given tag and attribute value below ``element``. The search
+        follows the child-axis path between both levels of the hierarchy (e.g. Chamber -> SuperLayer),
+        so it does not descend into unrelated parts of the subtree. The paths do not depend on the
+        value, so they are compiled once by the XPath engine and reused.
+
+        :return: The element found or None.
+        :rtype: xml.etree.ElementTree.Element or None
+        """
+        path = _CHILD_PATHS.get((element.tag, tag), f".//{tag}")
+        value = str(value)
+        return next(
+            (child for child in element.iterfind(path) if child.get(tag_attribute) == value), None
+        )
+
+    def _layer_wires(self, layer):
+        """
+        Get the wires of a Layer indexed by their number. The index is built on first use, so looking up
+        every wire of a layer does not scan its wires once per lookup.
+
+        :param layer: The Layer element.
+        :type layer: xml.etree.ElementTree.Element
+        :return: The Wire elements of the layer keyed by their wireNumber attribute.
+        :rtype: dict
+        """
+        rawId = int(layer.get("rawId"))
+        if rawId not in self._wires:
+            self._wires[rawId] = {
+                wire.get("wireNumber"): wire
+                for wire in layer.iterfind(_CHILD_PATHS[("Layer", "Wire")])
+            }
+        return self._wires[rawId]
+
+    def _lookup(self, attribute=None, **kwargs):
+        """
+        Perform the actual XML query for :meth:`get`. Arguments are the same as in :meth:`get`.
+        """
+        if attribute in _VECTOR_FIELDS and kwargs.keys() == {"rawId"}:
+            row = self._row.get(self._as_rawid(kwargs["rawId"]))
+            if row is not None:
+                return tuple(self._vectors[attribute][row].tolist())
+
         query = "."
+        element = self.root
         if "rawId" in kwargs:
             query += f"//*[@rawId='{kwargs['rawId']}']"
+            element = self._by_rawid.get(self._as_rawid(kwargs["rawId"]))
         if all(key in kwargs for key in ["wh", "sec", "st"]):
-            query += f"//Chamber"
-            query += f"[@Id=' Wh:{kwargs['wh']} St:{kwargs['st']} Se:{kwargs['sec']} ']"
-        if "sl" in kwargs:
-            query += f"//SuperLayer"
-            query += f"[@superLayerNumber='{kwargs['sl']}']"
-        if "l" in kwargs:
-            query += f"//Layer"
-            query += f"[@layerNumber='{kwargs['l']}']"
-        if "w" in kwargs:
-            query += f"//Wire"
-            query += f"[@wireNumber='{kwargs['w']}']"
-
-        element = self.root.find(query)
+            chamber_id = f" Wh:{kwargs['wh']} St:{kwargs['st']} Se:{kwargs['sec']} "
+            query += f"//Chamber[@Id='{chamber_id}']"
+            if element is self.root:
+                element = self._by_chamber_id.get(chamber_id)
+            elif element is not None:
+                element = self._find_child(element, "Chamber", "Id", chamber_id)
+        for key, tag, tag_attribute in _QUERY_STEPS:
+            if key in kwargs:
+                query += f"//{tag}[@{tag_attribute}='{kwargs[key]}']"
+                if element is not None:
+                    if tag == "Wire" and element.tag == "Layer":
+                        element = self._layer_wires(element).get(str(kwargs[key]))
+                    else:
+                        element = self._find_child(element, tag, tag_attribute, kwargs[key])
         if attribute is None:
             return element
 
         if element is not None:
-            if attribute in ["GlobalPosition", "LocalPosition", "NormalVector"]:
-                try:
-                    x, y, z = self._transform_to_pos(str_pos_tuple=element.find(attribute).text)
-                except AttributeError:
-                    x, y, z = self._transform_to_pos(str_pos_tuple=element.get(attribute))
-                return x, y, z
-            elif attribute == "Bounds":
-                width, height, length = element.find(attribute).attrib.values()
-                return (float(width), float(height), float(length))
+            if attribute in _VECTOR_FIELDS:
+                return self._read_vector(element, attribute)
             elif "wire" in attribute.lower():
                 element = element.find(".//Wires")
-                width, height, length, first, last = element.attrib.values()
                 if attribute == "WiresSize":
-                    return (float(width), float(height), float(length))
+                    return self._read_bounds(element)
                 elif attribute == "WiresRange":
-                    return (int(first), int(last))
+                    return (int(element.get("first")), int(element.get("last")))
                 else:
                     return element
             else:
@@ -88,25 +307,74 @@ class DTGeometry:
         else:
             raise ValueError(f"Element not found for query: {query}")
 
+    @classmethod
+    def _read_vector(cls, element, attribute):
+        """
+        Read a position-like or bounds field of an element.
+
+        :param element: The element holding the field.
+        :type element: xml.etree.ElementTree.Element
+        :param attribute: The field to read ('LocalPosition', 'GlobalPosition', 'NormalVector', or 'Bounds').
+        :type attribute: str
+        :return: The field values as a tuple of floats.
+        :rtype: tuple
+        """
+        if attribute == "Bounds":
+            return cls._read_bounds(element.find(attribute))
+        try:
+            return cls._transform_to_pos(str_pos_tuple=element.find(attribute).text)
+        except AttributeError:
+            return cls._transform_to_pos(str_pos_tuple=element.get(attribute))
+
+    @staticmethod
+    def _read_bounds(element):
+        """
+        Read the space dimensions stored in the attributes of an element (e.g. Bounds or Wires).
+
+        :param element: The element holding the width, thickness, and length attributes.
+        :type element: xml.etree.ElementTree.Element
+        :return: A tuple containing the (width, height, length) dimensions.
+        :rtype: tuple
+        """
+        return (
+            float(element.get("width")),
+            float(element.get("thickness")),
+            float(element.get("length")),
+        )
+
     @staticmethod
     def _transform_to_pos(str_pos_tuple):
         """
         Transform a string representation of coordinates into a tuple of floats.
 
-        :param str: The string containing the coordinates.
-        :type str: str
-        :param local: Flag to determine if the coordinates are local or global.
-        :type local: bool, optional
+        :param str_pos_tuple: The string containing the coordinates, e.g. ``"(x, y, z)"`` or ``"x y z"``.
+        :type str_pos_tuple: str
         :return: A tuple containing the transformed coordinates.
         :rtype: tuple
         """
-        cords = re.findall(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", str_pos_tuple)
-        x, y, z = (float(cord) for cord in cords)
+        cords = str_pos_tuple.replace("(", " ").replace(")", " ").replace(",", " ").split()
+        x, y, z = map(float, cords)
         return (x, y, z)
 
 
-# Initialize the DTGeometry object with the path to the XML file
-DTGEOMETRY = DTGeometry(os.path.join(os.path.dirname(__file__), "./DTGeometry_v3.xml"))
+_XML_PATH = os.path.join(os.path.dirname(__file__), "./DTGeometry_v3.xml")
+
+
+@cache
+def _load_geometry():
+    """
+    Initialize the default DTGeometry object with the path to the XML file. The file is parsed only
+    once, the first time the geometry is used.
+    """
+    return DTGeometry(_XML_PATH)
+
+
+def __getattr__(name):
+    # DTGEOMETRY is loaded lazily, so importing the package does not pay the XML parsing
+    if name == "DTGEOMETRY":
+        return _load_geometry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Example usage
 if __name__ == "__main__":
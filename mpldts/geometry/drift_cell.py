@@ -12,7 +12,7 @@
 #         <------- 4.2 cm --------->
 
 
-from mpldts.geometry._geometry import DTGEOMETRY
+from mpldts.geometry import _geometry
 from mpldts.geometry.dt_frame import DTFrame
 from mpldts.geometry.transforms import TransformManager
 import warnings as Warning
@@ -32,9 +32,17 @@ class DriftCell(DTFrame):
             Number of the drift cell. Same as id.
 
         Others inherit from ``mpldts.geometry.DTFrame``... (e.g. local_center, direction, etc.)
+
+    .. note::
+        - Arbitrary information (e.g. time) can be attached to drift cells (see
+          ``Station.set_cell_attrs``). It is kept in the ``__dict__`` inherited from DTFrame.
+        - The transformer of a drift cell is only set up when it is first accessed, since most cells of a
+          station are never moved between frames.
     """
 
-    def __init__(self, number=-1, parent=None):
+    __slots__ = ("_transformer", "_to_layer")
+
+    def __init__(self, number=-1, parent=None, geometry=None):
         """
         Constructor for DriftCell.
 
@@ -42,53 +50,80 @@ class DriftCell(DTFrame):
         :type number: int, optional
         :param parent: Parent layer of the drift cell (default is None).
         :type parent: Layer, optional
+        :param geometry: Geometrical information of the cell, as the wires returned by ``DTGeometry.walk``
+            for its layer. If None, it is retrieved from the DT geometry using the parent rawId. Default is None.
+        :type geometry: dict, optional
         """
         # Parent rawId is used to get XML geometrical info to initialize
         # the instance. If not parent, attributes are set manually...
         self.parent = parent
-        super().__init__()
+        self._transformer = None
+        self._to_layer = None
         self.id = number
         self.number = number
 
-        if parent:
-            self.bounds = DTGEOMETRY.get("WiresSize", rawId=parent.id)
-            self.local_center = DTGEOMETRY.get("LocalPosition", rawId=parent.id, w=number)
-            self.global_center = DTGEOMETRY.get("GlobalPosition", rawId=parent.id, w=number)
-
+        if geometry is not None:
+            local_center = geometry["LocalPosition"]
+            global_center = geometry["GlobalPosition"]
+            bounds = geometry["Bounds"]
+        elif parent:
+            local_center, global_center, _, bounds = _geometry.DTGEOMETRY.get_frame_attrs(
+                parent.id, w=number
+            )
         else:
-            self.bounds = (4.2, 1.3, 235)
-            self.local_center = (0, 0, 0)
-            self.global_center = (0, 0, 0)
+            local_center, global_center, bounds = (0, 0, 0), (0, 0, 0), (4.2, 1.3, 235)
+
+        self.bounds = bounds
+        self.local_center = local_center
+        self.global_center = global_center
 
-    def _setup_tranformer(self):
+    @property
+    def transformer(self):
+        """
+        Transform manager of the drift cell. It is set up on first access.
+
+        :return: The transform manager of the cell.
+        :rtype: TransformManager
+        """
+        if self._transformer is None:
+            self._setup_tranformer(self._to_layer)
+        return self._transformer
+
+    @transformer.setter
+    def transformer(self, value):
+        """
+        Set the transform manager of the drift cell.
+
+        :param value: The transform manager.
+        :type value: TransformManager
+        """
+        self._transformer = value
+
+    def _setup_tranformer(self, to_layer=None):
         """
         Set up the transformer for the Drift Cell. It defines the transformation from the local frame to the global frame.
+
+        :param to_layer: 4x4 transformation matrix from the cell to the layer frame. If None, it is computed
+            from the cell and parent layer local centers. Default is None.
+        :type to_layer: ndarray, optional
         """
         from numpy import array
 
-        self.transformer = TransformManager("Cell")  # intial frame is the layer frame
-
-        # Inherit transformation from the parent to the global frame
-        if self.parent is not None:
-            transform_matrix = self.parent.transformer.get_transformation("Station", "CMS")
-            if transform_matrix is not None:
-                self.transformer.add("Station", "CMS", transformation_matrix=transform_matrix)
-            transform_matrix = self.parent.transformer.get_transformation("SuperLayer", "Station")
-            if transform_matrix is not None:
-                self.transformer.add(
-                    "SuperLayer", "Station", transformation_matrix=transform_matrix
-                )
-            transform_matrix = self.parent.transformer.get_transformation("Layer", "SuperLayer")
-            if transform_matrix is not None:
-                self.transformer.add("Layer", "SuperLayer", transformation_matrix=transform_matrix)
+        # Share the transformations from the parent to the global frame instead of copying them
+        self._transformer = TransformManager(
+            "Cell", base=self.parent.transformer if self.parent is not None else None
+        )  # intial frame is the cell frame
 
+        if to_layer is not None:
+            self._transformer.add("Cell", "Layer", transformation_matrix=to_layer)
+        elif self.parent is not None:
             # Define the transformation from the cell to the Layer frame
             _parent_center = self.parent.local_center
             _LTC = array([self._x_local, self._y_local, self._z_local]) - array(
                 _parent_center
             )  # This translation leave te cords in the SL frame
 
-            self.transformer.add(
+            self._transformer.add(
                 "Cell", "Layer", translation_vector=_LTC
             )  # add the transformation from cell to Layer frame
 
@@ -1,6 +1,9 @@
 from mpldts.geometry.transforms import compute_eta, compute_theta
 import warnings
 
+# sentinel for attributes that have not been assigned yet
+_MISSING = object()
+
 
 class DTFrame:
     """
@@ -42,8 +45,36 @@ class DTFrame:
     .. note::
         - This class can be subclassed to create specific types of DT geometrical objects, such as DT cells, Layers, or SuperLayers.
         - The `global_cords_at_min` property is not implemented and will raise a warning if accessed.
+        - The known attributes are stored in ``__slots__`` to reduce the memory footprint and
+          speed up the access of the (many) DT objects. Subclasses should declare their own
+          ``__slots__`` to keep this benefit. Instances still have a ``__dict__``, so arbitrary
+          information can be attached to them, and can be weakly referenced.
+        - ``theta`` and ``eta`` are computed on first access and kept until the global center changes.
     """
 
+    __slots__ = (
+        "_id",
+        "_parent",
+        "_number",
+        "_width",
+        "_height",
+        "_length",
+        "_bounds",
+        "_x_local",
+        "_y_local",
+        "_z_local",
+        "_local_center",
+        "_x_global",
+        "_y_global",
+        "_z_global",
+        "_global_center",
+        "_theta",
+        "_eta",
+        "_direction",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(self):
         """
         Initialize the DTFrame object.
@@ -77,11 +108,14 @@ class DTFrame:
         :return: Identifier of the object.
         :rtype: int
         """
-        try:
-            return self._id
-        except AttributeError:
-            warnings.warn(f"This {self.__class__.__name__} instance does not have an ID assigned.")
+        id = getattr(self, "_id", _MISSING)
+        if id is _MISSING:
+            warnings.warn(
+                f"This {self.__class__.__name__} instance does not have an ID assigned.",
+                stacklevel=2,
+            )
             return None
+        return id
 
     @property
     def parent(self):
@@ -91,11 +125,13 @@ class DTFrame:
         :return: Parent of the object.
         :rtype: object
         """
-        try:
-            return self._parent
-        except AttributeError:
-            warnings.warn(f"This {self.__class__.__name__} instance does not have a Parent.")
+        parent = getattr(self, "_parent", _MISSING)
+        if parent is _MISSING:
+            warnings.warn(
+                f"This {self.__class__.__name__} instance does not have a Parent.", stacklevel=2
+            )
             return None
+        return parent
 
     @property
     def number(self):
@@ -105,13 +141,14 @@ class DTFrame:
         :return: Number of the Object.
         :rtype: int
         """
-        try:
-            return self._number
-        except AttributeError:
+        number = getattr(self, "_number", _MISSING)
+        if number is _MISSING:
             warnings.warn(
-                f"This {self.__class__.__name__} instance does not have a Number assigned."
+                f"This {self.__class__.__name__} instance does not have a Number assigned.",
+                stacklevel=2,
             )
             return None
+        return number
 
     @property
     def width(self):
@@ -151,7 +188,7 @@ class DTFrame:
         :return: Space dimensions of the object.
         :rtype: tuple
         """
-        return self._width, self._height, self._length
+        return self._bounds
 
     @property
     def local_center(self):
@@ -161,7 +198,7 @@ class DTFrame:
         :return: Local center coordinates (x, y, z).
         :rtype: tuple
         """
-        return self._x_local, self._y_local, self._z_local
+        return self._local_center
 
     @property
     def direction(self):
@@ -171,16 +208,16 @@ class DTFrame:
         :return: Direction of the object.
         :rtype: tuple
         """
-        try:
-            return self._direction
-        except AttributeError:
-            if self.parent:
-                return self.parent.direction
-            else:
-                warnings.warn(
-                    f"This {self.__class__.__name__} instance does not have a Direction assigned."
-                )
-                return None
+        direction = getattr(self, "_direction", _MISSING)
+        if direction is not _MISSING:
+            return direction
+        if self.parent:
+            return self.parent.direction
+        warnings.warn(
+            f"This {self.__class__.__name__} instance does not have a Direction assigned.",
+            stacklevel=2,
+        )
+        return None
 
     @property
     def global_center(self):
@@ -190,7 +227,7 @@ class DTFrame:
         :return: Global center coordinates (x, y, z).
         :rtype: tuple
         """
-        return self._x_global, self._y_global, self._z_global
+        return self._global_center
 
     @property
     def local_cords_at_min(self):
@@ -216,7 +253,9 @@ class DTFrame:
         :return: Global cords at minimum coordinates (x, y, z).
         :rtype: tuple
         """
-        warnings.warn("Global coordinates at the minimum position is not implemented yet.")
+        warnings.warn(
+            "Global coordinates at the minimum position is not implemented yet.", stacklevel=2
+        )
         return None
 
     @property
@@ -227,7 +266,9 @@ class DTFrame:
         :return: Angle theta of the object in radians.
         :rtype: float
         """
-        return compute_theta(self._x_global, self._y_global, self._z_global)
+        if self._theta is None:
+            self._theta = compute_theta(self._x_global, self._y_global, self._z_global)
+        return self._theta
 
     @property
     def eta(self):
@@ -237,7 +278,9 @@ class DTFrame:
         :return: Pseudorapidity of the object.
         :rtype: float
         """
-        return compute_eta(self._x_global, self._y_global, self._z_global)
+        if self._eta is None:
+            self._eta = compute_eta(self._x_global, self._y_global, self._z_global)
+        return self._eta
 
     @id.setter
     def id(self, id: int):
@@ -278,6 +321,11 @@ class DTFrame:
         :type bounds: tuple
         """
         self._width, self._height, self._length = bounds
+        # tuples are immutable, so the given one is shared (e.g. by all cells of a layer) instead
+        # of copied. The same applies to the centers, shared with the memoized geometry walks
+        self._bounds = (
+            bounds if type(bounds) is tuple else (self._width, self._height, self._length)
+        )
 
     @local_center.setter
     def local_center(self, cords: tuple):
@@ -288,6 +336,9 @@ class DTFrame:
         :type cords: tuple
         """
         self._x_local, self._y_local, self._z_local = cords
+        self._local_center = (
+            cords if type(cords) is tuple else (self._x_local, self._y_local, self._z_local)
+        )
 
     @direction.setter
     def direction(self, direction: tuple):
@@ -308,3 +359,8 @@ class DTFrame:
         :type cords: tuple
         """
         self._x_global, self._y_global, self._z_global = cords
+        self._global_center = (
+            cords if type(cords) is tuple else (self._x_global, self._y_global, self._z_global)
+        )
+        # theta and eta are computed from the global center on first access
+        self._theta = self._eta = None
@@ -1,4 +1,6 @@
-from mpldts.geometry._geometry import DTGEOMETRY, DTGeometry
+import numpy as np
+
+from mpldts.geometry import _geometry
 from mpldts.geometry.dt_frame import DTFrame
 from mpldts.geometry.drift_cell import DriftCell
 from mpldts.geometry.transforms import TransformManager
@@ -20,7 +22,9 @@ class Layer(DTFrame):
         Others inherit from ``mpldts.geometry.DTFrame``... (e.g. id, local_center, global_center, direction, etc.)
     """
 
-    def __init__(self, rawId=None, parent=None):
+    __slots__ = ("_first_cell_id", "_last_cell_id", "_DriftCells", "_cells_by_id", "transformer")
+
+    def __init__(self, rawId=None, parent=None, geometry=None):
         """
         Constructor of the Layer class.
 
@@ -28,23 +32,29 @@ class Layer(DTFrame):
         :type rawId: int
         :param parent: Parent super layer of the layer. Default is None.
         :type parent: SuperLayer, optional
+        :param geometry: Geometrical information of the layer, as returned by ``DTGeometry.walk``.
+            If None, it is retrieved from the DT geometry using the rawId. Default is None.
+        :type geometry: dict, optional
         """
         self.id = rawId
         self.parent = parent
         if rawId is not None:
-            self.number = int(DTGEOMETRY.get("layerNumber", rawId=rawId))
-            self.local_center = DTGEOMETRY.get("LocalPosition", rawId=rawId)
-            self.global_center = DTGEOMETRY.get("GlobalPosition", rawId=rawId)
-            self.bounds = DTGEOMETRY.get("Bounds", rawId=rawId)
+            if geometry is None:
+                geometry = _geometry.DTGEOMETRY.walk(rawId)
+            self.number = geometry["number"]
+            self.local_center = geometry["LocalPosition"]
+            self.global_center = geometry["GlobalPosition"]
+            self.bounds = geometry["Bounds"]
             # these attributes are used inside cell() method to check if the cell_id is valid
-            self._first_cell_id, self._last_cell_id = DTGEOMETRY.get("WiresRange", rawId=rawId)
+            self._first_cell_id, self._last_cell_id = geometry["WiresRange"]
         else:
             self._first_cell_id = 1
             self._last_cell_id = 50
 
         self._setup_tranformer()
         self._DriftCells = []
-        self._build_layer()
+        self._cells_by_id = {}
+        self._build_layer(geometry)
 
     @property
     def cells(self):
@@ -81,37 +91,34 @@ class Layer(DTFrame):
         """
         if cell_number < self._first_cell_id or cell_number > self._last_cell_id:
             raise ValueError(f"Invalid cell number: {cell_number}")
-        return next((c for c in self._DriftCells if c.id == cell_number), None)
-
-    def _add_cell(self, cell):
-        """
-        Add a new cell to the layer.
+        return self._cells_by_id.get(cell_number)
 
-        :param cell: Drift cell to be added.
-        :type cell: DriftCell
-        """
-        self._DriftCells.append(cell)
-
-    def _build_layer(self):
+    def _build_layer(self, geometry):
         """
         Ensemble a DT layer.
+
+        :param geometry: Geometrical information of the layer, as returned by ``DTGeometry.walk``.
+            If None, it is retrieved from the DT geometry using the layer id.
+        :type geometry: dict
+        :raises ValueError: If the layer id is not found in the DT geometry.
         """
-        wire_bounds = DTGEOMETRY.get("WiresSize", rawId=self.id)
-        for wire in DTGEOMETRY.get("Wires", rawId=self.id).iter("Wire"):
-            num, local_pos_str, global_pos_str = wire.attrib.values()
+        if geometry is None:
+            geometry = _geometry.DTGEOMETRY.walk(self.id)
 
-            cell = DriftCell(number=int(num))
+        wires = geometry["children"]
 
-            local_pos = DTGeometry._transform_to_pos(local_pos_str)
-            global_pos = DTGeometry._transform_to_pos(global_pos_str)
+        # Cell -> Layer transformations of all the cells at once (pure translations)
+        to_layer = np.tile(np.eye(4), (len(wires), 1, 1))
+        to_layer[:, :3, 3] = np.array(
+            [wire["LocalPosition"] for wire in wires], dtype=float
+        ).reshape(-1, 3) - np.asarray(self.local_center)
 
-            cell.local_center = local_pos
-            cell.global_center = global_pos
-            cell.bounds = wire_bounds
-            cell.parent = self
-            cell._setup_tranformer()
+        cells = [DriftCell(number=wire["number"], parent=self, geometry=wire) for wire in wires]
+        for cell, matrix in zip(cells, to_layer):
+            cell._to_layer = matrix  # the cell transformer is set up on first access
 
-            self._add_cell(cell)
+        self._DriftCells = cells
+        self._cells_by_id = {cell.id: cell for cell in cells}
 
     def _setup_tranformer(self):
         """
@@ -123,10 +130,10 @@ class Layer(DTFrame):
 
         # Inherit transformation from the parent to the global frame
         if self.parent is not None:
-            transform_matrix = self.parent.transformer.get_transformation("Station", "CMS")
+            transform_matrix = self.parent.transformer._get_transformation("Station", "CMS")
             if transform_matrix is not None:
                 self.transformer.add("Station", "CMS", transformation_matrix=transform_matrix)
-            transform_matrix = self.parent.transformer.get_transformation("SuperLayer", "Station")
+            transform_matrix = self.parent.transformer._get_transformation("SuperLayer", "Station")
             if transform_matrix is not None:
                 self.transformer.add(
                     "SuperLayer", "Station", transformation_matrix=transform_matrix
@@ -1,11 +1,49 @@
-from mpldts.geometry._geometry import DTGEOMETRY
+from mpldts.geometry import _geometry
 from mpldts.geometry.dt_frame import DTFrame
 from mpldts.geometry.super_layer import SuperLayer
 from mpldts.geometry.transforms import TransformManager
 from pandas import DataFrame
-from copy import deepcopy
+from functools import cache
 import warnings
 
+_CELL_ID_KEYS = frozenset(("sl", "l", "w"))
+
+
+@cache
+def _natural_view_transforms(face_orientation):
+    """
+    Compute the transformations from the Station frame to its 'Natural view' frames (NV phi/eta). They only
+    depend on the face orientation of the station, so they are computed once per orientation and shared.
+
+    :param face_orientation: Orientation of the station face (-1 or 1).
+    :type face_orientation: int
+    :return: The (Station -> StationNvPhi, Station -> StationNvEta) read-only 4x4 transformation matrices.
+    :rtype: tuple of numpy.ndarray
+    """
+    from pytransform3d.rotations import perpendicular_to_vectors
+    from pytransform3d.transformations import transform_from
+    from numpy import array, zeros
+
+    StNvezSt = array([0, 0, -1])
+    StNvPhieySt = array([0, -1, 0]) * face_orientation
+    StNvPhiexSt = perpendicular_to_vectors(StNvPhieySt, StNvezSt)
+
+    _RStNvPhiSt = array(
+        [StNvPhiexSt, StNvPhieySt, StNvezSt]
+    ).T  # rotation matrix from local to global frame
+
+    StNvEtaexSt = array([-1, 0, 0]) * face_orientation
+    StNvEtaeySt = perpendicular_to_vectors(StNvezSt, StNvEtaexSt)
+
+    _RStNvEtaSt = array(
+        [StNvEtaexSt, StNvEtaeySt, StNvezSt]
+    ).T  # rotation matrix from local to global frame
+
+    transforms = (transform_from(_RStNvPhiSt, zeros(3)), transform_from(_RStNvEtaSt, zeros(3)))
+    for transform in transforms:
+        transform.flags.writeable = False
+    return transforms
+
 
 class Station(DTFrame):
     """
@@ -27,6 +65,8 @@ class Station(DTFrame):
         Others inherit from ``mpldts.geometry.DTFrame``... (e.g. id, local_center, global_center, direction, etc.)
     """
 
+    __slots__ = ("_wheel", "_sector", "_super_layers", "transformer")
+
     def __init__(self, wheel, sector, station, dt_info=None):
         """
         Constructor of the Station class.
@@ -46,16 +86,17 @@ class Station(DTFrame):
         self.wheel = wheel
         self.sector = sector
         self.number = station
-        self.id = DTGEOMETRY.get("rawId", wh=wheel, sec=sector, st=station)
-        self.local_center = DTGEOMETRY.get("LocalPosition", rawId=self.id)
-        self.global_center = DTGEOMETRY.get("GlobalPosition", rawId=self.id)
-        self.direction = DTGEOMETRY.get("NormalVector", rawId=self.id)
-        self.bounds = DTGEOMETRY.get("Bounds", rawId=self.id)
+        self.id = _geometry.DTGEOMETRY.get("rawId", wh=wheel, sec=sector, st=station)
+        geometry = _geometry.DTGEOMETRY.walk(self.id)
+        self.local_center = geometry["LocalPosition"]
+        self.global_center = geometry["GlobalPosition"]
+        self.direction = geometry["NormalVector"]
+        self.bounds = geometry["Bounds"]
         self._setup_tranformer()
 
         # == Build the station
         self._super_layers = []
-        self._build_station()
+        self._build_station(geometry)
 
         # == Set the drift cell attributes
         if dt_info is not None:
@@ -165,12 +206,15 @@ class Station(DTFrame):
         """
         self._super_layers.append(super_layer)
 
-    def _build_station(self):
+    def _build_station(self, geometry):
         """
         Build up the station. It creates the super layers contained in the station.
+
+        :param geometry: Geometrical information of the station, as returned by ``DTGeometry.walk``.
+        :type geometry: dict
         """
-        for SL in DTGEOMETRY.get(rawId=self.id).iter("SuperLayer"):
-            self._add_super_layer(SuperLayer(rawId=SL.get("rawId"), parent=self))
+        for SL in geometry["children"]:
+            self._add_super_layer(SuperLayer(rawId=SL["rawId"], parent=self, geometry=SL))
 
     def _setup_tranformer(self):
         """
@@ -208,24 +252,9 @@ class Station(DTFrame):
         )  # add the transformation from local to global frame
 
         # add a orientation transformation (Station 'Natural view' - NV phi/eta), useful for matplotlib ploting.
-        StNvezSt = array([0, 0, -1])
-        StNvPhieySt = array([0, -1, 0]) * face_orientation
-        StNvPhiexSt = perpendicular_to_vectors(StNvPhieySt, StNvezSt)
-
-        _RStNvPhiSt = array(
-            [StNvPhiexSt, StNvPhieySt, StNvezSt]
-        ).T  # rotation matrix from local to global frame
-
-        self.transformer.add("Station", "StationNvPhi", rotation_matrix=_RStNvPhiSt)
-
-        StNvEtaexSt = array([-1, 0, 0]) * face_orientation
-        StNvEtaeySt = perpendicular_to_vectors(StNvezSt, StNvEtaexSt)
-
-        _RStNvPhiSt = array(
-            [StNvEtaexSt, StNvEtaeySt, StNvezSt]
-        ).T  # rotation matrix from local to global frame
-
-        self.transformer.add("Station", "StationNvEta", rotation_matrix=_RStNvPhiSt)
+        _TStNvPhiSt, _TStNvEtaSt = _natural_view_transforms(face_orientation)
+        self.transformer.add("Station", "StationNvPhi", transformation_matrix=_TStNvPhiSt)
+        self.transformer.add("Station", "StationNvEta", transformation_matrix=_TStNvEtaSt)
 
     def set_cell_attrs(self, dt_info):
         """
@@ -236,35 +265,46 @@ class Station(DTFrame):
                 layer, and wire. e.g. ``[{"sl": 1, "l": 1, "w": 1, "time": 300}, ...]``
         :type dt_info: dict, list, or pandas.DataFrame
         """
+        # the items are only read, so the given dicts are used as they are
         if isinstance(dt_info, dict):
-            info = [deepcopy(dt_info)]
+            info = [dt_info]
         elif isinstance(dt_info, DataFrame):
-            info = dt_info.to_dict(orient="records")
+            # column-wise extraction: tolist gives native python values as to_dict does, but faster
+            columns = list(dt_info.columns)
+            if not _CELL_ID_KEYS.issubset(columns):  # fail before converting any row
+                raise ValueError(
+                    "The drift cell information must contain the super layer, layer, and wire identifiers."
+                )
+            info = [dict(zip(columns, row)) for row in zip(*(dt_info[c].tolist() for c in columns))]
         elif isinstance(dt_info, list):
-            info = deepcopy(dt_info)
+            info = dt_info
         else:
             raise TypeError(
                 "The drift time information must be a dictionary, a list of dictionaries, or a pandas DataFrame."
             )
 
+        missing_super_layers = set()  # warned once each
         for info_item in info:
-            sl = info_item.pop("sl", None)
-            l = info_item.pop("l", None)
-            w = info_item.pop("w", None)
-            if not all([sl, l, w]):
+            sl = info_item.get("sl")
+            l = info_item.get("l")
+            w = info_item.get("w")
+            if not (sl and l and w):
                 raise ValueError(
                     "The drift cell information must contain the super layer, layer, and wire identifiers."
                 )
             super_layer = self.super_layer(sl)
 
             if super_layer is None:
-                warnings.warn(f"Super layer {sl} does not exist in station {self.name}.")
+                if sl not in missing_super_layers:
+                    missing_super_layers.add(sl)
+                    warnings.warn(f"Super layer {sl} does not exist in station {self.name}.")
                 continue
 
-            cell = self.super_layer(sl).layer(l).cell(w)
+            cell = super_layer.layer(l).cell(w)
 
             for key, value in info_item.items():
-                setattr(cell, key, value)
+                if key not in _CELL_ID_KEYS:
+                    setattr(cell, key, value)
 
 
 if __name__ == "__main__":
@@ -293,5 +333,5 @@ if __name__ == "__main__":
             print(3 * "\t", l.cell(len(l.cells) - 1))
     print(
         "\t",
-        f"properties contained into cells: {st.super_layer(1).layer(1).cells[0].__dict__.keys()}",
+        f"properties contained into cells: {vars(st.super_layer(1).layer(1).cells[0]).keys()}",
     )
@@ -1,4 +1,4 @@
-from mpldts.geometry._geometry import DTGEOMETRY
+from mpldts.geometry import _geometry
 from mpldts.geometry.dt_frame import DTFrame
 from mpldts.geometry.layer import Layer
 from mpldts.geometry.transforms import TransformManager
@@ -20,7 +20,9 @@ class SuperLayer(DTFrame):
         Others inherit from ``mpldts.geometry.DTFrame``... (e.g. id, local_center, global_center, direction, etc.)
     """
 
-    def __init__(self, rawId=None, parent=None):
+    __slots__ = ("_layers", "transformer")
+
+    def __init__(self, rawId=None, parent=None, geometry=None):
         """
         Constructor of the SuperLayer class.
 
@@ -28,17 +30,22 @@ class SuperLayer(DTFrame):
         :type rawId: int
         :param parent: Parent station of the super layer. Default is None.
         :type parent: Station, optional
+        :param geometry: Geometrical information of the super layer, as returned by ``DTGeometry.walk``.
+            If None, it is retrieved from the DT geometry using the rawId. Default is None.
+        :type geometry: dict, optional
         """
         self.id = rawId
         self.parent = parent
         if rawId is not None:
-            self.number = int(DTGEOMETRY.get("superLayerNumber", rawId=rawId))
-            self.local_center = DTGEOMETRY.get("LocalPosition", rawId=rawId)
-            self.global_center = DTGEOMETRY.get("GlobalPosition", rawId=rawId)
-            self.bounds = DTGEOMETRY.get("Bounds", rawId=rawId)
+            if geometry is None:
+                geometry = _geometry.DTGEOMETRY.walk(rawId)
+            self.number = geometry["number"]
+            self.local_center = geometry["LocalPosition"]
+            self.global_center = geometry["GlobalPosition"]
+            self.bounds = geometry["Bounds"]
         self._setup_tranformer()
         self._layers = []
-        self._build_super_layer()
+        self._build_super_layer(geometry)
 
     @property
     def layers(self):
@@ -83,12 +90,19 @@ class SuperLayer(DTFrame):
         """
         self._layers.append(layer)
 
-    def _build_super_layer(self):
+    def _build_super_layer(self, geometry):
         """
         Build up the super layer. It creates the layers contained in the super layer.
+
+        :param geometry: Geometrical information of the super layer, as returned by ``DTGeometry.walk``.
+            If None, it is retrieved from the DT geometry using the super layer id.
+        :type geometry: dict
+        :raises ValueError: If the super layer id is not found in the DT geometry.
         """
-        for layer in DTGEOMETRY.get(rawId=self.id).iter("Layer"):
-            self._add_layer(Layer(layer.get("rawId"), parent=self))
+        if geometry is None:
+            geometry = _geometry.DTGEOMETRY.walk(self.id)
+        for layer in geometry["children"]:
+            self._add_layer(Layer(layer["rawId"], parent=self, geometry=layer))
 
     def _setup_tranformer(self):
         """
@@ -99,7 +113,7 @@ class SuperLayer(DTFrame):
         self.transformer = TransformManager("SuperLayer")  # intial frame is the SL frame
         # Inherit transformation from the parent to the global frame
         if self.parent is not None:
-            transform_matrix = self.parent.transformer.get_transformation("Station", "CMS")
+            transform_matrix = self.parent.transformer._get_transformation("Station", "CMS")
             if transform_matrix is not None:
                 self.transformer.add("Station", "CMS", transformation_matrix=transform_matrix)
 
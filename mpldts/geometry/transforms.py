@@ -1,8 +1,11 @@
+import math
 import numpy as np
-import pytransform3d.transformations as pt
 import pytransform3d.rotations as pr
 import warnings
 
+_IDENTITY_3 = np.eye(3)
+_HOMOGENEOUS_ROW = np.array([0.0, 0.0, 0.0, 1.0])
+
 
 class TransformManager:
     """
@@ -12,6 +15,9 @@ class TransformManager:
     -----------
     transform_chain : dict
         Dictionary to store the transformation matrices between frames.
+    base : TransformManager or None
+        Transform manager whose transformations are shared (not copied) by this one. Frames and
+        transformations of the base are available as if they were defined in this manager.
 
     .. rubric:: Example
 
@@ -37,21 +43,62 @@ class TransformManager:
         This class is powered by the `pytransform3d <https://dfki-ric.github.io/pytransform3d/index.html>`_ library.
     """
 
-    def __init__(self, initial_frame="A"):
+    def __init__(self, initial_frame="A", base=None):
         """
         Initialize the TransformManager with an initial reference frame name.
 
         :param initial_frame: The initial reference frame (default is "A" = Identity).
         :type initial_frame: str
+        :param base: Transform manager to share the transformations with, e.g. the one of the parent object.
+            Transformations added to this manager do not modify the base. Default is None.
+        :type base: TransformManager, optional
         """
+        self.base = base
         self.transform_chain = {
             (initial_frame, initial_frame): np.eye(4),
         }
 
         self.available_frames = {initial_frame}
+        # composed transformations already found, with the state they were found in
+        self._composed = {}
+        self._version = 0
 
     def __str__(self):
-        return f"TransformManager: {' <-> '.join(sorted(self.available_frames))}"
+        return f"TransformManager: {' <-> '.join(sorted(self._frames()))}"
+
+    def _frames(self):
+        """
+        Get the frames defined in this manager and in its base.
+
+        :return: The available frames.
+        :rtype: set
+        """
+        if self.base is None:
+            return self.available_frames
+        return self.available_frames | self.base._frames()
+
+    def _state(self):
+        """
+        Get the state of the transformations of this manager and of its base. It changes whenever a
+        transformation is added or removed from any of them.
+
+        :return: The versions of this manager and of its base chain.
+        :rtype: tuple
+        """
+        if self.base is None:
+            return (self._version,)
+        return (self._version, *self.base._state())
+
+    def _transforms(self):
+        """
+        Iterate over the transformations defined in this manager and in its base.
+
+        :return: Iterator of ((from_frame, to_frame), transformation_matrix) pairs.
+        :rtype: iterator
+        """
+        yield from self.transform_chain.items()
+        if self.base is not None:
+            yield from self.base._transforms()
 
     def add(
         self,
@@ -75,6 +122,8 @@ class TransformManager:
         :param translation_vector: The translation vector for the transformation.
         :type translation_vector: ndarray, optional
         :raises ValueError: If both transformation_matrix and (rotation_matrix, translation_vector) are None.
+        :raises ValueError: If the resulting transformation is not a rigid homogeneous transformation
+            (e.g. the rotation is a reflection).
         :raises TypeError: If from_frame or to_frame are not strings.
         :raises ValueError: If from_frame and to_frame are the same.
         """
@@ -95,24 +144,25 @@ class TransformManager:
             raise ValueError("Cannot modify the identity transformation.")
 
         if transformation_matrix is not None:
-            self.transform_chain[(from_frame, to_frame)] = transformation_matrix
+            # validated here once, since the inverse transformations are computed in closed form
+            self.transform_chain[(from_frame, to_frame)] = _check_transform(transformation_matrix)
         else:
+            # the matrix is built directly and checked with the same (cheaper) validation as the
+            # transformation_matrix input, instead of going through transform_from
+            transform = np.eye(4)
             if rotation_matrix is not None:
                 if pr.matrix_requires_renormalization(rotation_matrix):
-                    rotation = pr.norm_matrix(rotation_matrix)
+                    transform[:3, :3] = pr.norm_matrix(rotation_matrix)
                 else:
-                    rotation = rotation_matrix
-            else:
-                rotation = np.eye(3)
+                    transform[:3, :3] = rotation_matrix
             if translation_vector is not None:
-                translation = translation_vector
-            else:
-                translation = np.zeros(3)
+                transform[:3, 3] = translation_vector
 
-            self.transform_chain[(from_frame, to_frame)] = pt.transform_from(rotation, translation)
+            self.transform_chain[(from_frame, to_frame)] = _check_transform(transform)
 
         self.available_frames.add(from_frame)
         self.available_frames.add(to_frame)
+        self._version += 1
 
     def remove(self, from_frame, to_frame):
         """
@@ -129,6 +179,7 @@ class TransformManager:
             raise ValueError("Cannot remove the identity transformation.")
         if key in self.transform_chain:
             del self.transform_chain[key]
+            self._version += 1
 
     def get_transformation(self, from_frame, to_frame):
         """
@@ -141,6 +192,27 @@ class TransformManager:
         :return: The 4x4 homogeneous transformation matrix or None if no path found.
         :rtype: ndarray or None
         """
+        transform = self._get_transformation(from_frame, to_frame)
+        return None if transform is None else transform.copy()
+
+    def _get_transformation(self, from_frame, to_frame):
+        """
+        Get the composed transformation matrix from the from_frame to the to_frame, without copying
+        it. Composed transformations are memoized until a transformation is added to or removed from
+        this manager or its base, so the returned matrix is shared and read-only.
+
+        :param from_frame: The name of the starting reference frame.
+        :type from_frame: str
+        :param to_frame: The name of the ending reference frame.
+        :type to_frame: str
+        :return: The 4x4 homogeneous transformation matrix or None if no path found.
+        :rtype: ndarray or None
+        """
+        state = self._state()
+        composed = self._composed.get((from_frame, to_frame))
+        if composed is not None and composed[0] == state:
+            return composed[1]
+
         # Initialize a set to keep track of visited frames
         visited = set()
         # Initialize a stack with the starting frame and an identity transformation matrix
@@ -152,22 +224,24 @@ class TransformManager:
             current_frame, current_transform = stack.pop()
             # If the current frame is the target frame, return the accumulated transformation
             if current_frame == to_frame:
+                current_transform.flags.writeable = False
+                self._composed[(from_frame, to_frame)] = (state, current_transform)
                 return current_transform
             # Mark the current frame as visited
             visited.add(current_frame)
 
             # Iterate through all transformations in the transform chain
-            for (src, dst), transform in self.transform_chain.items():
+            for (src, dst), transform in self._transforms():
                 # If the current frame is the source and the destination is not visited
                 if src == current_frame and dst not in visited:
                     # Concatenate the current transformation with the new transformation
-                    new_transform = pt.concat(current_transform, transform)
+                    new_transform = transform @ current_transform
                     # Add the destination frame and the new transformation to the stack
                     stack.append((dst, new_transform))
                 # If the current frame is the destination and the source is not visited
                 elif dst == current_frame and src not in visited:
                     # Concatenate the current transformation with the inverse of the new transformation
-                    new_transform = pt.concat(current_transform, pt.invert_transform(transform))
+                    new_transform = _invert_transform(transform) @ current_transform
                     # Add the source frame and the new transformation to the stack
                     stack.append((src, new_transform))
 
@@ -191,24 +265,65 @@ class TransformManager:
         :raises TypeError: If P is not a list, tuple, or ndarray.
         :raises ValueError: If the transformation path is not found or if the frames are not defined.
         """
-        if from_frame not in self.available_frames or to_frame not in self.available_frames:
+        frames = self._frames()
+        if from_frame not in frames or to_frame not in frames:
             raise ValueError(
                 f"One or both of the frames '{from_frame}' or '{to_frame}' are not defined."
             )
 
-        matrix = self.get_transformation(from_frame, to_frame)
+        matrix = self._get_transformation(from_frame, to_frame)
         if matrix is None:
             raise ValueError(f"No transformation path found from {from_frame} to {to_frame}.")
 
         if not isinstance(P, (list, tuple, np.ndarray)):
             raise TypeError("P must be a list, tuple, or ndarray.")
 
-        if len(np.shape(P)) > 1:
-            points = pt.vectors_to_points(P)
-        else:
-            points = pt.vector_to_point(P)
+        # apply the affine transformation to all the points with a single matrix product
+        return np.asarray(P, dtype=float) @ matrix[:3, :3].T + matrix[:3, 3]
+
 
-        return pt.transform(matrix, points)[..., :3]
+def _check_transform(matrix, tolerance=1e-6):
+    """
+    Check that a matrix is a rigid 4x4 homogeneous transformation (orthonormal rotation with
+    determinant 1, plus translation).
+
+    :param matrix: The transformation matrix to check.
+    :type matrix: array_like
+    :param tolerance: The tolerance allowed in the checks.
+    :type tolerance: float
+    :return: The transformation matrix as a float array.
+    :rtype: ndarray
+    :raises ValueError: If the matrix is not a rigid homogeneous transformation.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.shape != (4, 4):
+        raise ValueError(
+            f"Expected a homogeneous transformation matrix with shape (4, 4), got {matrix.shape}."
+        )
+    rotation = matrix[:3, :3]
+    if (
+        abs(rotation @ rotation.T - _IDENTITY_3).max() > tolerance
+        or abs(matrix[3] - _HOMOGENEOUS_ROW).max() > tolerance
+        or abs(np.linalg.det(rotation) - 1.0) > tolerance
+    ):
+        raise ValueError(f"Expected a rigid homogeneous transformation matrix, got {matrix!r}.")
+    return matrix
+
+
+def _invert_transform(matrix):
+    """
+    Invert a rigid 4x4 homogeneous transformation using its closed form. The matrix is not validated
+    here, the transformations are checked when they are added to a ``TransformManager``.
+
+    :param matrix: The transformation matrix to invert.
+    :type matrix: ndarray
+    :return: The inverse transformation matrix.
+    :rtype: ndarray
+    """
+    inverse = np.eye(4)
+    inverse[:3, :3] = matrix[:3, :3].T
+    inverse[:3, 3] = -inverse[:3, :3] @ matrix[:3, 3]
+    return inverse
 
 
 def compute_theta(x, y, z):
@@ -232,11 +347,9 @@ def compute_theta(x, y, z):
         if z > 0:
             return 0.0
         else:
-            return np.pi
+            return math.pi
 
-    r = np.sqrt(x**2 + y**2)
-
-    return np.arctan2(r, z)
+    return math.atan2(math.hypot(x, y), z)
 
 
 def compute_eta(x, y, z):
@@ -251,12 +364,14 @@ def compute_eta(x, y, z):
     :type z: float
     :return: The angle eta in radians.
     :rtype: float
+    :raises ValueError: If the origin point (0, 0, 0) is provided.
     """
-    theta = compute_theta(x, y, z)
-
-    if theta == 0 or theta == np.pi:
+    if x == 0 and y == 0:
+        if z == 0:
+            raise ValueError("origin point (0, 0, 0) has not a defined eta")
         return float("inf")
 
-    eta = -1 * np.log(np.tan(theta / 2))
+    # -ln(tan(theta / 2)) reduces to asinh(z / r), a single transcendental call
+    eta = math.asinh(z / math.hypot(x, y))
 
     return eta
@@ -1,8 +1,12 @@
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import PatchCollection, PolyCollection
 from matplotlib.patches import Rectangle
-from mpldts.geometry import Station, DriftCell, SuperLayer
+from numpy import array, asarray, hstack
+from mpldts.geometry import Station, SuperLayer
 from mpldts.patches.dt_patch_base import DTRelatedPatch
 
+# corners of the unit square, used to build the vertices of rectangles (x_min, y_min, width, height)
+_UNIT_SQUARE = array([[0, 0], [1, 0], [1, 1], [0, 1]])
+
 
 class DTStationPatch(DTRelatedPatch):
     """
@@ -13,8 +17,8 @@ class DTStationPatch(DTRelatedPatch):
         bounds_collection : matplotlib.collections.PatchCollection
             A collection of patches representing the bounds of the station and its superlayers.
 
-        cells_collection : matplotlib.collections.PatchCollection
-            A collection of patches representing each DT cell, with optional colormap based on time information.
+        cells_collection : matplotlib.collections.PolyCollection
+            A collection of polygons representing each DT cell, with optional colormap based on time information.
         station : Station
             The Station object containing the geometry information.
         axes : matplotlib.axes.Axes
@@ -30,8 +34,9 @@ class DTStationPatch(DTRelatedPatch):
 
     .. important::
 
-        Be aware that this is not a child class of ``matplotlib.patches.Patch``. Instead, it creates a couple of
-        ``matplotlib.collections.PatchCollection`` objects to draw the station bounds and the cells.
+        Be aware that this is not a child class of ``matplotlib.patches.Patch``. Instead, it creates a
+        ``matplotlib.collections.PatchCollection`` to draw the station bounds and a
+        ``matplotlib.collections.PolyCollection`` to draw the cells.
     """
 
     def __init__(
@@ -63,7 +68,7 @@ class DTStationPatch(DTRelatedPatch):
         :type vmap: str, optional
         :param bounds_kwargs: Additional keyword arguments to apply specifically to the bounds PatchCollection.
         :type bounds_kwargs: dict, optional
-        :param cells_kwargs: Additional keyword arguments to apply specifically to the cells PatchCollection.
+        :param cells_kwargs: Additional keyword arguments to apply specifically to the cells PolyCollection.
         :type cells_kwargs: dict, optional
         :param kwargs: Additional keyword arguments to apply to both collections.
         :type kwargs: dict, optional
@@ -77,7 +82,7 @@ class DTStationPatch(DTRelatedPatch):
         self.bounds_collection.set_picker(True)
         self.bounds_collection.station = station
 
-        self.cells_collection = PatchCollection(
+        self.cells_collection = PolyCollection(
             [], **(cells_kwargs or {"facecolor": "none", "edgecolor": "k"}), **(kwargs or {})
         )
 
@@ -116,6 +121,9 @@ class DTStationPatch(DTRelatedPatch):
         """
         cells = []
         vars = []
+        # bind what is used per cell outside the loops
+        vmap = self.vmap
+        add_cell, add_var = cells.append, vars.append
         for super_layer in self.station.super_layers:
             if self.view == "phi" and super_layer.number == 2:
                 continue  # skip superlayer 2
@@ -123,18 +131,26 @@ class DTStationPatch(DTRelatedPatch):
                 continue  # skip superlayer 1 and 3
             for layer in super_layer.layers:
                 for cell in layer.cells:
-                    cell_patch = self._create_frame(cell)
-                    var = getattr(cell, self.vmap, 0)
-
-                    cells.append(cell_patch)
-                    vars.append(var)
-
-        self.cells_collection.set_paths(cells)
+                    add_cell(cell.local_center + cell.bounds)
+                    add_var(getattr(cell, vmap, 0))
+
+        # cells are never rotated, so their rectangles can be built all at once from the
+        # (x, y, z, width, height, length) rows. The corners are the local cords at min of the cells.
+        cells = asarray(cells, dtype=float).reshape(-1, 6)
+        sizes = cells[:, 3:5]
+        corners = cells[:, [0, 2]] - sizes / 2
+        self.cells_collection.set_verts(self._rectangles_vertices(hstack([corners, sizes])))
         self.cells_collection.set_array(vars)
 
     def _create_frame(self, obj):
         """
-        Create a frame (matplotlib.patches.Rectangle) for the given object.
+        Create a frame (matplotlib.patches.Rectangle) for the given station or super layer. Drift
+        cells are drawn in bulk by ``_draw_cells``.
+
+        :param obj: The station or super layer to create the frame for.
+        :type obj: Station or SuperLayer
+        :return: The frame of the object.
+        :rtype: matplotlib.patches.Rectangle
         """
         width, height, length = obj.bounds
         x_min, y_min, z_min = obj.local_cords_at_min
@@ -143,11 +159,9 @@ class DTStationPatch(DTRelatedPatch):
             x_min, y_min, z_min = y_min, -x_min, z_min
             width = length
 
-        if (
-            self.view == "eta"
-            and not isinstance(obj, DriftCell)
-            and (obj.number != 2 or isinstance(obj, Station))
-        ):  # if SL1 or SL3
+        if self.view == "eta" and (
+            obj.number != 2 or isinstance(obj, Station)
+        ):  # if SL1 or SL3 or the station
             x_min, y_min, z_min = -y_min, x_min, z_min
             x_min = x_min - length
             width = length
@@ -156,6 +170,19 @@ class DTStationPatch(DTRelatedPatch):
 
         return frame
 
+    @staticmethod
+    def _rectangles_vertices(rectangles):
+        """
+        Compute the vertices of a set of rectangles in a single vectorized operation.
+
+        :param rectangles: Rectangles given as (x_min, y_min, width, height).
+        :type rectangles: list of tuple
+        :return: The vertices of the rectangles, with shape (n_rectangles, 4, 2).
+        :rtype: numpy.ndarray
+        """
+        rectangles = asarray(rectangles, dtype=float).reshape(-1, 4)
+        return rectangles[:, None, :2] + _UNIT_SQUARE[None] * rectangles[:, None, 2:]
+
     def change_vmap(self, vmap):
         """
         Change the variable to map to the colormap. Drift cells without the attribute will be set to 0.
@@ -171,8 +198,6 @@ class DTStationPatch(DTRelatedPatch):
             elif self.view == "eta" and super_layer.number != 2:
                 continue  # skip superlayer 1 and 3
             for layer in super_layer.layers:
-                for cell in layer.cells:
-                    var = getattr(cell, self.vmap, 0)
-                    vars.append(var)
+                vars.extend(getattr(cell, vmap, 0) for cell in layer.cells)
 
         self.cells_collection.set_array(vars)